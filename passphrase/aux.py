@@ -22,7 +22,7 @@
 
 from subprocess import Popen, PIPE, DEVNULL
 from os.path import isfile, getsize
-from typing import Union
+from typing import Union, Tuple
 from sys import stderr
 
 from .secrets import randbelow
@@ -99,23 +99,6 @@ class Aux:
 
         return arr
 
-    @staticmethod
-    def _make_one_char_uppercase(string: str) -> str:
-        """Make a single char from the string uppercase."""
-        if not isinstance(string, str):
-            raise TypeError('string must be a string')
-
-        if Aux.lowercase_count(string) > 0:
-            while True:
-                cindex = randbelow(len(string))
-                if string[cindex].islower():
-                    aux = list(string)
-                    aux[cindex] = aux[cindex].upper()
-                    string = ''.join(aux)
-                    break
-
-        return string
-
     @staticmethod
     def make_chars_uppercase(
             lst: Union[list, tuple, str, set],
@@ -145,42 +128,76 @@ class Aux:
             # Make it all uppercase
             return Aux.make_all_uppercase(lst)
 
-        arr = list(lst)
+        # Pick the characters to make uppercase all at once among every
+        # lowercase character, using a partial Fisher-Yates shuffle, instead
+        # of picking characters at random until enough of them are lowercase.
+        total = Aux._lowercase_supported_count(lst)
+        positions = list(range(total))
+        for i in range(min(uppercase, total)):
+            j = i + randbelow(total - i)
+            positions[i], positions[j] = positions[j], positions[i]
 
-        # Check if at least an element is supported
-        # This is required to avoid an infinite loop below
-        supported = False
-        for element in arr:
-            if isinstance(element, (list, tuple, str, set)):
-                supported = True
-                break
-
-        if supported:
-            # Pick a word at random, then make a character uppercase
-            count = 0
-            while count < uppercase:
-                windex = randbelow(len(arr))
-                element = arr[windex]
-                # Skip unsupported types or empty ones
-                if element:
-                    aux = element
-                    if isinstance(element, str):
-                        aux = Aux._make_one_char_uppercase(element)
-                    elif isinstance(element, (list, tuple, set)):
-                        aux = Aux.make_chars_uppercase(element, 1)
-
-                    if aux != element:
-                        arr[windex] = aux
-                        count += 1
+        return Aux._make_positions_uppercase(
+            lst,
+            set(positions[:uppercase])
+        )[0]
 
-        if isinstance(lst, set):
-            return set(arr)
-        elif isinstance(lst, str):
-            return ''.join(arr)
-        elif isinstance(lst, tuple):
-            return tuple(arr)
+    @staticmethod
+    def _lowercase_supported_count(element: any) -> int:
+        """Return the number of lowercase chars in supported elements.
 
-        return arr
+        Supported elements are those that make_chars_uppercase can modify:
+        a (mix of) string, list, tuple or set.
+
+        """
+        if isinstance(element, str):
+            return sum(1 for char in element if char.islower())
+        elif isinstance(element, (list, tuple, set)):
+            return sum(
+                Aux._lowercase_supported_count(item) for item in element
+            )
+
+        return 0
+
+    @staticmethod
+    def _make_positions_uppercase(
+            element: any,
+            positions: set,
+            offset: int = 0
+    ) -> Tuple[any, int]:
+        """Make uppercase the lowercase chars at the given positions.
+
+        Positions are indexes among all the lowercase chars in supported
+        elements, counted in iteration order and starting at offset.
+        Return the modified element and the offset for the next one.
+
+        """
+        if isinstance(element, str):
+            chars = list(element)
+            for cindex, char in enumerate(chars):
+                if char.islower():
+                    if offset in positions:
+                        chars[cindex] = char.upper()
+                    offset += 1
+            return ''.join(chars), offset
+        elif not isinstance(element, (list, tuple, set)):
+            return element, offset
+
+        arr = []
+        for item in element:
+            item, offset = Aux._make_positions_uppercase(
+                item,
+                positions,
+                offset
+            )
+            arr.append(item)
+
+        if isinstance(element, set):
+            return set(arr), offset
+        elif isinstance(element, tuple):
+            return tuple(arr), offset
+
+        return arr, offset
 
     @staticmethod
     def isfile_notempty(inputfile: str) -> bool:
@@ -21,6 +21,7 @@
 """Auxiliar calculations."""
 
 from typing import Union, List, Tuple
+from collections import Counter
 from math import ceil, fabs, log10, log2
 
 __version__ = '0.4.8'
@@ -47,16 +48,11 @@ def entropy_bits(
     if n_lst <= 1:
         return 0.0
 
-    # Some NumPy replacements
-    counts = [lst.count(x) for x in lst]
-    probs = [c / n_lst for c in counts]
+    # Probability of each distinct element, counted in a single pass
+    probs = [count / n_lst for count in Counter(lst).values()]
 
     # Compute entropy
-    entropy = 0.0
-    for prob in probs:
-        entropy -= prob * log2(prob)
-
-    return entropy
+    return -sum(prob * log2(prob) for prob in probs)
 
 
 def entropy_bits_nrange(
@@ -26,7 +26,7 @@ characters.
 
 """
 
-from typing import Union, List, Tuple
+from typing import Union, List, Tuple, Iterator
 from string import digits, ascii_lowercase, ascii_uppercase, punctuation
 
 from .wordlist import EFF_LONG_WORDLIST, EFF_LONG_WORDLIST_ENTROPY
@@ -36,7 +36,7 @@ from .calc import entropy_bits_nrange as calc_entropy_bits_nrange
 from .calc import passphrase_entropy as calc_passphrase_entropy
 from .calc import password_entropy as calc_password_entropy
 from .calc import entropy_bits as calc_entropy_bits
-from .secrets import randchoice, randhex, randbetween
+from .secrets import randchoices, randhex, randbetween_many
 from .settings import MIN_NUM, MAX_NUM
 from .aux import Aux
 
@@ -45,10 +45,50 @@ __author__ = 'HacKan'
 __license__ = 'GNU GPL 3.0+'
 __version__ = '0.6.0'
 
+# Lowercased once, at import time, instead of on every generated passphrase
+_EFF_LONG_WORDLIST_LOWER = tuple(word.lower() for word in EFF_LONG_WORDLIST)
+
+# Amount of password characters to generate at once when streaming
+_PASSWORD_CHUNK_LEN = 1024
+
 
 class Passphrase:
     """Generate cryptographically secure passphrases, passwords and more."""
 
+    __slots__ = (
+        '_randnum_min',
+        '_randnum_max',
+        '_separator',
+        '_password_use_lowercase',
+        '_password_use_uppercase',
+        '_password_use_digits',
+        '_password_use_punctuation',
+        '_password_chars_cache',
+        '_passwordlen',
+        '_amount_n',
+        '_amount_w',
+        '_entropy_bits_req',
+        '_wordlist',
+        '_wordlist_lower',
+        '_wordlist_entropy_bits',
+        'last_result',
+    )
+
+    # Settings that can be given to from_validated()
+    _VALIDATED_SETTINGS = (
+        'randnum_min',
+        'randnum_max',
+        'separator',
+        'password_use_lowercase',
+        'password_use_uppercase',
+        'password_use_digits',
+        'password_use_punctuation',
+        'passwordlen',
+        'amount_n',
+        'amount_w',
+        'entropy_bits_req',
+    )
+
     @property
     def entropy_bits_req(self) -> float:
         """Entropy bits required (desired) to be used for calculations."""
@@ -139,7 +179,7 @@ class Passphrase:
         self._separator = sep
 
     @property
-    def wordlist(self) -> list:
+    def wordlist(self) -> tuple:
         """Wordlist for passphrase generation."""
         return self._wordlist
 
@@ -147,8 +187,7 @@ class Passphrase:
     def wordlist(self, words: Union[list, tuple]) -> None:
         if not isinstance(words, (list, tuple)):
             raise TypeError('wordlist can only be list or tuple')
-        self._wordlist = list(words)
-        self._wordlist_entropy_bits = None
+        self._set_wordlist(words)
 
     @property
     def password_use_lowercase(self) -> bool:
@@ -158,6 +197,7 @@ class Passphrase:
     @password_use_lowercase.setter
     def password_use_lowercase(self, use_lowercase: bool) -> None:
         self._password_use_lowercase = bool(use_lowercase)
+        self._password_chars_cache = None
 
     @property
     def password_use_uppercase(self) -> bool:
@@ -167,6 +207,7 @@ class Passphrase:
     @password_use_uppercase.setter
     def password_use_uppercase(self, use_uppercase: bool) -> None:
         self._password_use_uppercase = bool(use_uppercase)
+        self._password_chars_cache = None
 
     @property
     def password_use_digits(self) -> bool:
@@ -176,6 +217,7 @@ class Passphrase:
     @password_use_digits.setter
     def password_use_digits(self, use_digits: bool) -> None:
         self._password_use_digits = bool(use_digits)
+        self._password_chars_cache = None
 
     @property
     def password_use_punctuation(self) -> bool:
@@ -185,20 +227,54 @@ class Passphrase:
     @password_use_punctuation.setter
     def password_use_punctuation(self, use_punctuation: bool) -> None:
         self._password_use_punctuation = bool(use_punctuation)
+        self._password_chars_cache = None
 
     @staticmethod
     def _read_words_from_wordfile(inputfile: str) -> list:
-        return [
-            word.strip() for word in open(inputfile, mode='rt')
-        ]
+        with open(inputfile, mode='rt') as wordfile:
+            return wordfile.read().split()
 
     @staticmethod
     def _read_words_from_diceware(inputfile: str) -> list:
-        return [
-            word.split()[1] for word in open(inputfile, mode='rt')
-        ]
+        # Split at most twice: the word is always the second column
+        with open(inputfile, mode='rt') as wordfile:
+            return [
+                line.split(None, 2)[1]
+                for line in wordfile.read().splitlines()
+            ]
+
+    def _set_wordlist(
+            self,
+            words: Union[list, tuple],
+            words_lower: tuple = None,
+            entropy_bits: float = None
+    ) -> None:
+        """Set the wordlist along with its lowercased copy and its entropy.
+
+        Every change of the wordlist must be done through here so that the
+        cached values always match it. Precomputed ones can be given to avoid
+        calculating them.
+
+        """
+        # Stored as a tuple so it can't change behind the cached values.
+        # Tuples are immutable so there's no need to copy them.
+        words = words if isinstance(words, tuple) else tuple(words)
+        if words_lower is None:
+            words_lower = tuple(
+                word.lower() if isinstance(word, str) else word
+                for word in words
+            )
+        if entropy_bits is None:
+            entropy_bits = self.entropy_bits(words)
+
+        self._wordlist = words
+        self._wordlist_lower = words_lower
+        self._wordlist_entropy_bits = entropy_bits
 
     def _get_password_characters(self, cathegorized=False) -> str:
+        if not cathegorized and self._password_chars_cache is not None:
+            return self._password_chars_cache
+
         group = []
 
         if self.password_use_lowercase:
@@ -210,7 +286,11 @@ class Passphrase:
         if self.password_use_punctuation:
             group.append(punctuation)
 
-        return group if cathegorized else ''.join(group)
+        if cathegorized:
+            return group
+
+        self._password_chars_cache = ''.join(group)
+        return self._password_chars_cache
 
     def __init__(self,
                  inputfile: str = None,
@@ -238,11 +318,13 @@ class Passphrase:
         self._password_use_uppercase = True
         self._password_use_digits = True
         self._password_use_punctuation = True
+        self._password_chars_cache = None
         self._passwordlen = None
         self._amount_n = None
         self._amount_w = None
         self._entropy_bits_req = None
         self._wordlist = None
+        self._wordlist_lower = None
         self._wordlist_entropy_bits = None
         self.last_result = None
 
@@ -251,19 +333,35 @@ class Passphrase:
         elif inputfile is not None:
             self.import_words_from_file(inputfile, is_diceware)
 
+    @classmethod
+    def from_validated(cls, **settings) -> 'Passphrase':
+        """Create an instance with the given settings, skipping validation.
+
+        Settings are set directly, bypassing the type and value checks done
+        by their properties, so only use it with trusted, already validated
+        values. The wordlist can't be set this way: load or import it after.
+
+        Keyword arguments:
+        settings -- Any of randnum_min, randnum_max, separator,
+        password_use_lowercase, password_use_uppercase, password_use_digits,
+        password_use_punctuation, passwordlen, amount_n, amount_w and
+        entropy_bits_req.
+
+        """
+        passphrase = cls()
+        for name, value in settings.items():
+            if name not in cls._VALIDATED_SETTINGS:
+                raise TypeError('{} is not a valid setting'.format(name))
+            setattr(passphrase, '_' + name, value)
+
+        return passphrase
+
     def __str__(self) -> str:
         """Return elements from the last result separated by the separator."""
         if not self.last_result:
             return ''
 
-        separator_len = len(self.separator)
-        rm_last_separator = -separator_len if separator_len > 0 else None
-        return ''.join(
-            '{}{}'.format(w, self.separator) for w in map(
-                str,
-                self.last_result
-            )
-        )[:rm_last_separator:]
+        return self.separator.join(map(str, self.last_result))
 
     @staticmethod
     def entropy_bits(
@@ -294,8 +392,12 @@ class Passphrase:
 
     def load_internal_wordlist(self) -> None:
         """Load internal wordlist."""
-        self._wordlist = EFF_LONG_WORDLIST
-        self._wordlist_entropy_bits = EFF_LONG_WORDLIST_ENTROPY
+        # The entropy for EFF Large Wordlist is ~12.9, no need to calculate
+        self._set_wordlist(
+            EFF_LONG_WORDLIST,
+            _EFF_LONG_WORDLIST_LOWER,
+            EFF_LONG_WORDLIST_ENTROPY
+        )
 
     def import_words_from_file(self,
                                inputfile: str,
@@ -315,11 +417,10 @@ class Passphrase:
             raise FileNotFoundError('Input file does not exists, is not valid '
                                     'or is empty: {}'.format(inputfile))
 
-        self._wordlist_entropy_bits = None
         if is_diceware:
-            self._wordlist = self._read_words_from_diceware(inputfile)
+            self._set_wordlist(self._read_words_from_diceware(inputfile))
         else:
-            self._wordlist = self._read_words_from_wordfile(inputfile)
+            self._set_wordlist(self._read_words_from_wordfile(inputfile))
 
     def password_length_needed(self) -> int:
         """Calculate the needed password length to satisfy the entropy number.
@@ -361,16 +462,14 @@ class Passphrase:
         # I set the minimum entropy bits and calculate the amount of words
         # needed, cosidering the entropy of the wordlist.
         # Then: entropy_w * amount_w + entropy_n * amount_n >= ENTROPY_BITS_MIN
-        entropy_n = self.entropy_bits((self.randnum_min, self.randnum_max))
-
-        # The entropy for EFF Large Wordlist is ~12.9, no need to calculate
-        entropy_w = self._wordlist_entropy_bits \
-            if self._wordlist_entropy_bits \
-            else self.entropy_bits(self.wordlist)
+        # Numbers entropy is irrelevant if no number is going to be used
+        entropy_n = self.entropy_bits((self.randnum_min, self.randnum_max)) \
+            if self.amount_n \
+            else 0.0
 
         return calc_words_amount_needed(
             self.entropy_bits_req,
-            entropy_w,
+            self._wordlist_entropy_bits,
             entropy_n,
             self.amount_n
         )
@@ -404,28 +503,27 @@ class Passphrase:
         if self.amount_n == 0 and self.amount_w == 0:
             return 0.0
 
-        entropy_n = self.entropy_bits((self.randnum_min, self.randnum_max))
-
-        # The entropy for EFF Large Wordlist is ~12.9, no need to calculate
-        entropy_w = self._wordlist_entropy_bits \
-            if self._wordlist_entropy_bits \
-            else self.entropy_bits(self.wordlist)
+        # Numbers entropy is irrelevant if no number is going to be used
+        entropy_n = self.entropy_bits((self.randnum_min, self.randnum_max)) \
+            if self.amount_n \
+            else 0.0
 
         return calc_passphrase_entropy(
             self.amount_w,
-            entropy_w,
+            self._wordlist_entropy_bits,
             entropy_n,
             self.amount_n
         )
 
-    def generate(self, uppercase: int = None) -> list:
-        """Generate a list of words randomly chosen from a wordlist.
+    def _generate_iter(
+            self,
+            uppercase: int = None
+    ) -> Iterator[Union[str, int]]:
+        """Yield words randomly chosen from a wordlist, then numbers.
 
-        Keyword arguments:
-        uppercase -- An integer number indicating how many uppercase
-        characters are wanted: bigger than zero means that many characters and
-        lower than zero means all uppercase except that many. Use 0 to make
-        them all uppercase, and None for no one.
+        Words are generated all at once to handle uppercase characters, but
+        nothing is kept so it can be used for streaming without storing the
+        whole passphrase. Check generate() for the uppercase argument.
 
         """
         if (
@@ -437,16 +535,19 @@ class Passphrase:
                              "wordlist is empty or amount_n or "
                              "amount_w isn't set")
 
+        if self.amount_n and self.randnum_min > self.randnum_max:
+            raise ValueError("Can't generate passphrase: randnum_min is "
+                             "greater than randnum_max")
+
         if uppercase is not None and not isinstance(uppercase, int):
             raise TypeError('uppercase must be an integer number')
 
-        passphrase = []
-        for _ in range(0, self.amount_w):
-            passphrase.append(randchoice(self.wordlist).lower())
+        # Words are picked from the lowercased wordlist computed on load
+        passphrase = randchoices(self._wordlist_lower, self.amount_w)
 
         # Handle uppercase
-        lowercase = Aux.lowercase_count(passphrase)
         if passphrase and uppercase is not None:
+            lowercase = Aux.lowercase_count(passphrase)
             if (
                     uppercase < 0
                     and lowercase > (uppercase * -1)
@@ -463,15 +564,38 @@ class Passphrase:
                     uppercase
                 )
 
+        yield from passphrase
+
         # Handle numbers
-        for _ in range(0, self.amount_n):
-            passphrase.append(randbetween(MIN_NUM, MAX_NUM))
+        if self.amount_n:
+            yield from randbetween_many(
+                self.randnum_min,
+                self.randnum_max,
+                self.amount_n
+            )
+
+    def generate(self, uppercase: int = None) -> list:
+        """Generate a list of words randomly chosen from a wordlist.
+
+        Keyword arguments:
+        uppercase -- An integer number indicating how many uppercase
+        characters are wanted: bigger than zero means that many characters and
+        lower than zero means all uppercase except that many. Use 0 to make
+        them all uppercase, and None for no one.
+
+        """
+        passphrase = list(self._generate_iter(uppercase))
 
         self.last_result = passphrase
         return passphrase
 
-    def generate_password(self) -> list:
-        """Generate a list of random characters."""
+    def _generate_password_iter(self) -> Iterator[str]:
+        """Yield random characters.
+
+        Characters are generated in chunks, so it can be used for streaming
+        very long passwords without storing them whole.
+
+        """
         characterset = self._get_password_characters()
         if (
                 self.passwordlen is None
@@ -480,9 +604,15 @@ class Passphrase:
             raise ValueError("Can't generate password: character set is "
                              "empty or passwordlen isn't set")
 
-        password = []
-        for _ in range(0, self.passwordlen):
-            password.append(randchoice(characterset))
+        remaining = self.passwordlen
+        while remaining > 0:
+            chunklen = min(remaining, _PASSWORD_CHUNK_LEN)
+            yield from randchoices(characterset, chunklen)
+            remaining -= chunklen
+
+    def generate_password(self) -> list:
+        """Generate a list of random characters."""
+        password = list(self._generate_password_iter())
 
         self.last_result = password
         return password
@@ -495,15 +625,18 @@ class Passphrase:
         """
         # uuid4: 8-4-4-4-12: xxxxxxxx-xxxx-4xxx-{8,9,a,b}xxx-xxxxxxxxxxxx
         # instead of requesting small amounts of bytes, it's better to do it
-        # for the full amount of them.
-        hexstr = randhex(30)
+        # for the full amount of them: 30 digits plus one for the variant,
+        # which is still a single read of 16 bytes.
+        hexstr = randhex(31)
+        # Keep the 2 lower bits of the last digit, uniform in [8, 11]
+        variant = (int(hexstr[30], 16) & 3) | 8
 
         uuid4 = [
             hexstr[:8],
             hexstr[8:12],
             '4' + hexstr[12:15],
-            '{:x}{}'.format(randbetween(8, 11), hexstr[15:18]),
-            hexstr[18:]
+            '{:x}{}'.format(variant, hexstr[15:18]),
+            hexstr[18:30]
         ]
         self.last_result = uuid4
         return uuid4
@@ -60,6 +60,95 @@ def randchoice(seq: Union[str, list, tuple, dict, set]) -> any:
     return seq[index]
 
 
+def randchoices(seq: Union[str, list, tuple, dict, set], k: int) -> list:
+    """Return a list of *k* elements randomly chosen from the given sequence.
+
+    Elements are chosen with replacement, and all of them are picked from a
+    single random byte string which is much faster than calling randchoice
+    *k* times.
+    Raises TypeError if *seq* is not str, list, tuple, dict, set or *k* is
+    not an integer, a ValueError if *k* < 0 and an IndexError if *seq* is
+    empty.
+
+    >>> randchoices((1, 2, 'a', 'b'), 3)  #doctest:+SKIP
+    ['a', 1, 'a']
+
+    """
+    if not isinstance(seq, (str, list, tuple, dict, set)):
+        raise TypeError('seq must be str, list, tuple, dict or set')
+    if not isinstance(k, int):
+        raise TypeError('k must be an integer')
+    if k < 0:
+        raise ValueError('k must be greater than or equal to zero')
+    if len(seq) <= 0:
+        raise IndexError('seq must have at least one element')
+
+    if isinstance(seq, set):
+        seq = list(seq)
+    elif isinstance(seq, dict):
+        # Same as randchoice: return values of randomly chosen keys
+        seq = list(seq.values())
+
+    return [seq[index] for index in _randbelow_many(len(seq), k)]
+
+
+def _randbelow_many(num: int, k: int) -> list:
+    """Return a list of *k* random ints in the range [0,num).
+
+    Random bytes are requested in bulk and sliced in chunks of the minimum
+    amount of bytes needed, masked to the minimum amount of bits needed,
+    rejecting those chunks that are out of range.
+
+    """
+    if k == 0:
+        return []
+    if num == 1:
+        return [0] * k
+    if num <= 256:
+        return _randbelow_many_bytes(num, k)
+
+    nbits = (num - 1).bit_length()
+    mask = (1 << nbits) - 1
+    width = (nbits + 7) // 8
+    numbers = []
+    while len(numbers) < k:
+        # Request 30% more numbers than needed to compensate for rejections:
+        # ceil(missing * 1.3)
+        amount = ((k - len(numbers)) * 13 + 9) // 10
+        rbytes = random_randbytes(amount * width)
+        # Each number is built from its own fixed slice of bytes so the cost
+        # is linear in k: shifting a single big int built from the whole
+        # buffer copies it on every draw, which is quadratic.
+        numbers.extend(
+            randnum for randnum in (
+                int.from_bytes(rbytes[i:i + width], 'big') & mask
+                for i in range(0, amount * width, width)
+            ) if randnum < num
+        )
+
+    return numbers[:k]
+
+
+def _randbelow_many_bytes(num: int, k: int) -> list:
+    """Return a list of *k* random ints in the range [0,num), num <= 256.
+
+    Each random byte is used as is, rejecting only those above the biggest
+    multiple of num (none if num is a power of two), and reduced modulo num.
+
+    """
+    threshold = 256 // num * num
+    numbers = []
+    while len(numbers) < k:
+        # ceil(missing * 256 / threshold)
+        nbytes = -(-(k - len(numbers)) * 256 // threshold)
+        numbers.extend(
+            byte % num for byte in random_randbytes(nbytes)
+            if byte < threshold
+        )
+
+    return numbers[:k]
+
+
 def randbelow(num: int) -> int:
     """Return a random int in the range [0,num).
 
@@ -77,7 +166,8 @@ def randbelow(num: int) -> int:
         return 0
 
     # https://github.com/python/cpython/blob/3.6/Lib/random.py#L223
-    nbits = num.bit_length()    # don't use (n-1) here because n can be 1
+    # n can't be 1 here, so use (n-1): powers of two never get rejected
+    nbits = (num - 1).bit_length()
     randnum = random_randint(nbits)    # 0 <= randnum < 2**nbits
     while randnum >= num:
         randnum = random_randint(nbits)
@@ -99,6 +189,36 @@ def randbetween(lower: int, upper: int) -> int:
     return randbelow(upper - lower + 1) + lower
 
 
+def randbetween_many(lower: int, upper: int, k: int) -> list:
+    """Return a list of *k* random ints in the range [lower, upper].
+
+    All numbers are generated from a single random byte string which is much
+    faster than calling randbetween *k* times.
+    Raises ValueError if lower or upper is lower than 0, upper is lower than
+    lower or k < 0, and TypeError if any is not an integer.
+
+    >>> randbetween_many(1, 6, 3)  #doctest:+SKIP
+    [4, 1, 6]
+
+    """
+    if not isinstance(lower, int) or not isinstance(upper, int):
+        raise TypeError('lower and upper must be integers')
+    if not isinstance(k, int):
+        raise TypeError('k must be an integer')
+    if lower < 0 or upper < 0:
+        raise ValueError('lower and upper must be greater than or equal to '
+                         'zero')
+    if upper < lower:
+        raise ValueError('upper must be greater than lower')
+    if k < 0:
+        raise ValueError('k must be greater than or equal to zero')
+
+    return [
+        randnum + lower
+        for randnum in _randbelow_many(upper - lower + 1, k)
+    ]
+
+
 def randhex(ndigits: int) -> str:
     """Return a random text string of hexadecimal characters.
 
@@ -169,6 +169,31 @@ class TestValidInputs(TestCase):
             constants.SOMEMIXEDLIST_UPPERCASE
         )
 
+    def test_make_chars_uppercase_unsupported(self):
+        # Counting the whole list as a string finds lowercase chars in None
+        self.assertEqual(
+            Aux.make_chars_uppercase([None, 'ab'], 3),
+            [None, 'AB']
+        )
+        self.assertEqual(Aux.make_chars_uppercase([None, 1], 3), [None, 1])
+
+    def test_make_chars_uppercase_nested(self):
+        lst = [['ab', ('cd', {'ef'})], 'gh', 1]
+        for uppercase in range(1, 8):
+            for _ in range(0, 100):
+                lstupper = Aux.make_chars_uppercase(lst, uppercase)
+                self.assertIsInstance(lstupper, list)
+                self.assertIsInstance(lstupper[0], list)
+                self.assertIsInstance(lstupper[0][1], tuple)
+                self.assertIsInstance(lstupper[0][1][1], set)
+                self.assertIsInstance(lstupper[1], str)
+                self.assertEqual(lstupper[2], 1)
+                self.assertEqual(Aux.uppercase_count(lstupper), uppercase)
+                self.assertEqual(
+                    Aux.make_all_uppercase(lstupper),
+                    Aux.make_all_uppercase(lst)
+                )
+
     def test_system_entropy(self):
         self.assertGreater(Aux.system_entropy(), 0)
 
@@ -214,14 +239,6 @@ class TestInvalidInputs(TestCase):
             )
         self.assertRaises(ValueError, Aux.make_chars_uppercase, [], -1)
 
-    def test_make_one_char_uppercase(self):
-        for wrongtype in constants.WRONGTYPES_STR:
-            self.assertRaises(
-                TypeError,
-                Aux._make_one_char_uppercase,
-                wrongtype
-            )
-
     def test_isfile_notempty(self):
         for wrongtype in constants.WRONGTYPES_STR_INT:
             self.assertRaises(TypeError, Aux.isfile_notempty, wrongtype)
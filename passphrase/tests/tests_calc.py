@@ -34,6 +34,8 @@ class TestValidInputs(TestCase):
             ((), 0.0),
             ([], 0.0),
             ((1, ), 0.0),
+            ((1, 1, 2, 2), 1.0),
+            (['a', 'a', 'a', 'b'], 0.81),
         )
         for val in values:
             bits = passphrase.calc.entropy_bits(val[0])
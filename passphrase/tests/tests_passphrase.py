@@ -60,19 +60,40 @@ class TestValidInputs(TestCase):
 
         passp = Passphrase(self.words_file, False)
         self.assertIsInstance(passp, Passphrase)
-        self.assertEqual(passp.wordlist, constants.WORDS)
+        self.assertEqual(passp.wordlist, tuple(constants.WORDS))
 
         passp = Passphrase(self.wordsd_file, True)
         self.assertIsInstance(passp, Passphrase)
         self.assertEqual(
             passp.wordlist,
-            [word.split()[1] for word in constants.WORDSD]
+            tuple(word.split()[1] for word in constants.WORDSD)
         )
 
         passp = Passphrase('internal')
         self.assertIsInstance(passp, Passphrase)
         self.assertEqual(len(passp.wordlist), 7776)
 
+    def test_from_validated(self):
+        passp = Passphrase.from_validated(
+            amount_w=3,
+            amount_n=1,
+            separator='-',
+            password_use_punctuation=False
+        )
+        self.assertIsInstance(passp, Passphrase)
+        self.assertEqual(passp.amount_w, 3)
+        self.assertEqual(passp.amount_n, 1)
+        self.assertEqual(passp.separator, '-')
+        self.assertFalse(passp.password_use_punctuation)
+        self.assertIsNone(passp.passwordlen)
+        passp.load_internal_wordlist()
+        self.assertEqual(len(passp.generate()), 4)
+        self.assertEqual(str(passp).count('-'), 3)
+
+    def test_slots(self):
+        passp = Passphrase()
+        self.assertFalse(hasattr(passp, '__dict__'))
+
     def test_entropy_bits(self):
         self.assertAlmostEqual(
             Passphrase.entropy_bits(constants.WORDS),
@@ -122,6 +143,37 @@ class TestValidInputs(TestCase):
                         lowercase * -1
                     )
 
+    def test_generate_lowercased_words(self):
+        passp = Passphrase()
+        passp.wordlist = ['Vivacious', 'FRIGIDLY', 'condiment']
+        passp.amount_w = 10
+        passp.amount_n = 0
+        passphrase = passp.generate()
+        self.assertTrue(str(passp).islower())
+        for word in passphrase:
+            self.assertIn(word, ('vivacious', 'frigidly', 'condiment'))
+
+    def test_generate_numbers(self):
+        passp = Passphrase()
+        passp.load_internal_wordlist()
+        passp.amount_w = 0
+        passp.amount_n = 50
+        passp.randnum_min = 10
+        passp.randnum_max = 20
+        passphrase = passp.generate()
+        self.assertEqual(len(passphrase), 50)
+        self.assertTrue(all(10 <= num <= 20 for num in passphrase))
+
+        passp.randnum_min = 0
+        passp.randnum_max = 0
+        self.assertEqual(passp.generate(), [0] * 50)
+
+        passp.amount_w = 2
+        passp.amount_n = 0
+        passp.randnum_min = 10
+        passp.randnum_max = 5
+        self.assertEqual(len(passp.generate()), 2)
+
     def test_generate_password(self):
         length = randint(0, 10)
         passp = Passphrase()
@@ -130,6 +182,27 @@ class TestValidInputs(TestCase):
         self.assertIsInstance(passphrase, list)
         self.assertEqual(len(passphrase), length)
 
+    def test_generate_password_iter(self):
+        passp = Passphrase()
+        passp.passwordlen = 3000
+        characters = set(passp._get_password_characters())
+        count = 0
+        for char in passp._generate_password_iter():
+            self.assertIn(char, characters)
+            count += 1
+        self.assertEqual(count, 3000)
+        self.assertIsNone(passp.last_result)
+
+    def test_generate_iter(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 2
+        passphrase = list(passp._generate_iter(0))
+        self.assertEqual(len(passphrase), 6)
+        self.assertTrue(all(word.isupper() for word in passphrase[:4]))
+        self.assertTrue(all(isinstance(num, int) for num in passphrase[4:]))
+        self.assertIsNone(passp.last_result)
+
     def test_generate_uuid4(self):
         passp = Passphrase()
         passphrase = passp.generate_uuid4()
@@ -139,14 +212,23 @@ class TestValidInputs(TestCase):
         uuid4 = UUID(str(passp), version=4)
         self.assertEqual(str(passp), uuid4.hex)
 
+        variants = set()
+        for _ in range(100):
+            passphrase = passp.generate_uuid4()
+            self.assertEqual([len(part) for part in passphrase],
+                             [8, 4, 4, 4, 12])
+            self.assertEqual(passphrase[2][0], '4')
+            variants.add(passphrase[3][0])
+        self.assertEqual(variants, {'8', '9', 'a', 'b'})
+
     def test_import_words_from_file(self):
         passp = Passphrase()
         self.assertIsNone(passp.import_words_from_file(self.words_file, False))
-        self.assertEqual(passp.wordlist, constants.WORDS)
+        self.assertEqual(passp.wordlist, tuple(constants.WORDS))
         self.assertIsNone(passp.import_words_from_file(self.wordsd_file, True))
         self.assertEqual(
             passp.wordlist,
-            [word.split()[1] for word in constants.WORDSD]
+            tuple(word.split()[1] for word in constants.WORDSD)
         )
 
     def test_password_length_needed(self):
@@ -200,7 +282,24 @@ class TestValidInputs(TestCase):
     def test_wordlist(self):
         passp = Passphrase()
         passp.wordlist = constants.WORDS
-        self.assertEqual(passp.wordlist, list(constants.WORDS))
+        self.assertEqual(passp.wordlist, tuple(constants.WORDS))
+        self.assertIsInstance(passp.wordlist, tuple)
+        self.assertAlmostEqual(
+            passp._wordlist_entropy_bits,
+            constants.WORDS_ENTROPY,
+            places=2
+        )
+        words = tuple(constants.WORDS)
+        passp.wordlist = words
+        self.assertIs(passp.wordlist, words)
+
+        passp.wordlist = [1, 2, 'Abc']
+        self.assertEqual(passp.wordlist, (1, 2, 'Abc'))
+        passp.amount_w = 10
+        passp.amount_n = 0
+        self.assertTrue(
+            all(word in (1, 2, 'abc') for word in passp.generate())
+        )
 
     def test_to_string(self):
         passp = Passphrase()
@@ -305,6 +404,22 @@ class TestValidInputs(TestCase):
             r'\`\{\|\}\~]+'
         )
 
+    def test_password_use_changes_characters(self):
+        passp = Passphrase()
+        passp.separator = ''
+        passp.passwordlen = 20
+        passp.generate_password()
+        passp.password_use_lowercase = False
+        passp.password_use_uppercase = False
+        passp.password_use_punctuation = False
+        passp.generate_password()
+        self.assertRegex(str(passp), r'^\d+$')
+        self.assertAlmostEqual(
+            passp.generated_password_entropy(),
+            66.44,
+            places=2
+        )
+
 
 class TestInvalidInputs(TestCase):
 
@@ -321,6 +436,14 @@ class TestInvalidInputs(TestCase):
             True
         )
 
+    def test_from_validated(self):
+        for name in ('wordlist', 'last_result', 'nonexistent'):
+            self.assertRaises(
+                TypeError,
+                Passphrase.from_validated,
+                **{name: 1}
+            )
+
     def test_entropy_bits(self):
         for wrongtype in constants.WRONGTYPES_LIST_TUPLE:
             self.assertRaises(
@@ -483,6 +606,15 @@ class TestInvalidInputs(TestCase):
                 str(context.exception)
             )
 
+        passp.wordlist = constants.WORDS
+        self.assertRaises(TypeError, setattr, passp, 'wordlist', [{1: 2}])
+        self.assertEqual(passp.wordlist, tuple(constants.WORDS))
+        self.assertAlmostEqual(
+            passp._wordlist_entropy_bits,
+            constants.WORDS_ENTROPY,
+            places=2
+        )
+
     def test_generate(self):
         passp = Passphrase()
         self.assertRaises(ValueError, passp.generate)
@@ -496,6 +628,12 @@ class TestInvalidInputs(TestCase):
         for wrongtype in constants.WRONGTYPES_INT:
             self.assertRaises(TypeError, passp.generate, wrongtype)
 
+        passp.amount_w = 1
+        passp.amount_n = 1
+        passp.randnum_min = 10
+        passp.randnum_max = 5
+        self.assertRaises(ValueError, passp.generate)
+
     def test_generate_password(self):
         passp = Passphrase()
         self.assertRaises(ValueError, passp.generate_password)
@@ -39,6 +39,29 @@ class TestValidInputs(TestCase):
             rand = passphrase.secrets.randchoice(value)
             self.assertIn(rand, value)
 
+    def test_randchoices(self):
+        values = (
+            (1, 2, 3, 4),
+            [1, 2, 3, 4],
+            {1, 2, 3, 4},
+            '1234',
+            ('a', ),
+            tuple(range(94)),
+            tuple(range(256)),
+            tuple(range(1000)),
+        )
+        for value in values:
+            for k in (0, 1, 10, 100):
+                rand = passphrase.secrets.randchoices(value, k)
+                self.assertIsInstance(rand, list)
+                self.assertEqual(len(rand), k)
+                self.assertTrue(all(elem in value for elem in rand))
+
+        value = {1: 'a', 2: 'b', 3: 'c', 4: 'd'}
+        rand = passphrase.secrets.randchoices(value, 100)
+        self.assertEqual(len(rand), 100)
+        self.assertTrue(all(elem in value.values() for elem in rand))
+
     def test_randbelow(self):
         prev = 0
         repeat = 0
@@ -61,6 +84,21 @@ class TestValidInputs(TestCase):
             self.assertTrue(lower <= rand <= upper)
             lower = upper
 
+    def test_randbetween_many(self):
+        lower = 2
+        for upper in (2, 10, 100, 10000):
+            for k in (0, 1, 10, 100):
+                rand = passphrase.secrets.randbetween_many(lower, upper, k)
+                self.assertIsInstance(rand, list)
+                self.assertEqual(len(rand), k)
+                self.assertTrue(all(lower <= num <= upper for num in rand))
+            lower = upper
+        self.assertEqual(passphrase.secrets.randbetween_many(0, 0, 3), [0] * 3)
+
+        rand = passphrase.secrets.randbetween_many(100000, 999999, 100000)
+        self.assertEqual(len(rand), 100000)
+        self.assertTrue(all(100000 <= num <= 999999 for num in rand))
+
     def test_randhex(self):
         for i in (1, 10, 100):
             rand = passphrase.secrets.randhex(i)
@@ -96,6 +134,34 @@ class TestInvalidInputs(TestCase):
             {}
         )
 
+    def test_randchoices(self):
+        for wrongtype in constants.WRONGTYPES_LIST_SET_TUPLE_STR_DICT:
+            self.assertRaises(
+                TypeError,
+                passphrase.secrets.randchoices,
+                wrongtype,
+                1
+            )
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(
+                TypeError,
+                passphrase.secrets.randchoices,
+                (1, 2),
+                wrongtype
+            )
+        self.assertRaises(
+            ValueError,
+            passphrase.secrets.randchoices,
+            (1, 2),
+            -1
+        )
+        self.assertRaises(
+            IndexError,
+            passphrase.secrets.randchoices,
+            {},
+            1
+        )
+
     def test_randbelow(self):
         for wrongtype in constants.WRONGTYPES_INT:
             self.assertRaises(
@@ -117,6 +183,44 @@ class TestInvalidInputs(TestCase):
         self.assertRaises(ValueError, passphrase.secrets.randbetween, 0, 0)
         self.assertRaises(ValueError, passphrase.secrets.randbetween, -1, -1)
 
+    def test_randbetween_many(self):
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(
+                TypeError,
+                passphrase.secrets.randbetween_many,
+                wrongtype,
+                wrongtype,
+                1
+            )
+            self.assertRaises(
+                TypeError,
+                passphrase.secrets.randbetween_many,
+                1,
+                2,
+                wrongtype
+            )
+        self.assertRaises(
+            ValueError,
+            passphrase.secrets.randbetween_many,
+            -1,
+            -1,
+            1
+        )
+        self.assertRaises(
+            ValueError,
+            passphrase.secrets.randbetween_many,
+            2,
+            1,
+            1
+        )
+        self.assertRaises(
+            ValueError,
+            passphrase.secrets.randbetween_many,
+            1,
+            2,
+            -1
+        )
+
     def test_randhex(self):
         for wrongtype in constants.WRONGTYPES_INT:
             self.assertRaises(